@@ -0,0 +1,119 @@
+import logging
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "utils"))
+
+import setup_logger as setup_logger_module  # noqa: E402
+from setup_logger import setup_logger  # noqa: E402
+
+_HAS_FORK = "fork" in multiprocessing.get_all_start_methods()
+
+
+def _log_from_child(logger_name):
+    setup_logger(logger_name).info("child %d", os.getpid())
+
+
+class TestSetupLogger(unittest.TestCase):
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.logs_dir = tmp_dir.name
+
+        patcher = mock.patch.object(setup_logger_module, "_LOGS_DIR", self.logs_dir)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        setup_logger_module._log_dir.cache_clear()
+        self.addCleanup(setup_logger_module._log_dir.cache_clear)
+
+    def _teardown_logger(self, logger_name):
+        """Drain and detach the logger so the temporary directory can go away."""
+        _, queue_handler = setup_logger_module._QUEUE_HANDLERS.pop(logger_name)
+        queue_handler.close()
+        logging.getLogger(logger_name).removeHandler(queue_handler)
+        setup_logger_module._build_logger.cache_clear()
+
+    def _read_log(self, logger_name):
+        with open(os.path.join(self.logs_dir, f"{logger_name}.log"), encoding="utf-8") as f:
+            return f.read().splitlines()
+
+    def test_same_name_with_other_subfolder_raises(self):
+        setup_logger("subfolder_test", "s1")
+        self.addCleanup(self._teardown_logger, "subfolder_test")
+
+        with self.assertRaisesRegex(ValueError, "subfolder_test"):
+            setup_logger("subfolder_test", "s2")
+        self.assertFalse(os.path.exists(os.path.join(self.logs_dir, "s2")))
+
+    def test_settings_read_on_first_setup(self):
+        # simule un load_dotenv() appelé après l'import du module
+        setup_logger_module._log_settings.cache_clear()
+        self.addCleanup(setup_logger_module._log_settings.cache_clear)
+        with mock.patch.dict(os.environ, {"LOG_LEVEL": "warning", "LOG_BACKUP_COUNT": "2"}):
+            logger = setup_logger("settings_test")
+        self.addCleanup(self._teardown_logger, "settings_test")
+
+        self.assertEqual(logger.level, logging.WARNING)
+        _, queue_handler = setup_logger_module._QUEUE_HANDLERS["settings_test"]
+        file_handler = queue_handler.listener.handlers[0]
+        self.assertEqual(file_handler.backupCount, 2)
+
+    def test_parse_log_level(self):
+        parse = setup_logger_module._parse_log_level
+        self.assertEqual(parse(" info "), logging.INFO)
+        self.assertEqual(parse("20"), logging.INFO)
+        with self.assertRaisesRegex(ValueError, "LOG_LEVEL"):
+            parse("INFOO")
+
+    def test_cached_time_respects_datefmt(self):
+        formatter = setup_logger_module.CachedTimeFormatter()
+        record = logging.makeLogRecord({"created": 1_700_000_000.25, "msecs": 250.0})
+
+        self.assertEqual(
+            formatter.formatTime(record, "%H:%M"),
+            time.strftime("%H:%M", time.localtime(1_700_000_000)),
+        )
+        self.assertEqual(
+            formatter.formatTime(record),
+            time.strftime("%Y-%m-%d %H:%M:%S,250", time.localtime(1_700_000_000)),
+        )
+
+    def _assert_forked_children_log(self, logger_name):
+        ctx = multiprocessing.get_context("fork")
+        children = [ctx.Process(target=_log_from_child, args=(logger_name,)) for _ in range(3)]
+        for child in children:
+            child.start()
+        for child in children:
+            child.join()
+            self.assertEqual(child.exitcode, 0)
+
+        self._teardown_logger(logger_name)
+        lines = self._read_log(logger_name)
+
+        self.assertEqual(sum(line.endswith(" - INFO - parent") for line in lines), 1)
+        for child in children:
+            self.assertTrue(any(line.endswith(f" - INFO - child {child.pid}") for line in lines))
+
+    @unittest.skipUnless(_HAS_FORK, "fork start method not available")
+    def test_forked_children_records_reach_file(self):
+        setup_logger("fork_test").info("parent")
+        self._assert_forked_children_log("fork_test")
+
+    @unittest.skipUnless(_HAS_FORK, "fork start method not available")
+    def test_forked_children_log_with_extra_handler(self):
+        logger = setup_logger("fork_extra_test")
+        null_handler = logging.NullHandler()
+        logger.addHandler(null_handler)
+        self.addCleanup(logger.removeHandler, null_handler)
+
+        logger.info("parent")
+        self._assert_forked_children_log("fork_extra_test")
+
+
+if __name__ == "__main__":
+    unittest.main()
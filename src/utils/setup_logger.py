@@ -1,3 +1,212 @@
-# IF../../../logs/ doesnt exists create it , 
+"""Create the root ``logs/`` folder, optional subfolders, and per-scraper log files."""
 
-# methode to create a log file and optionaly a subfodler in the logs folder
\ No newline at end of file
+import logging
+import os
+import queue
+import time
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from multiprocessing import util as mp_util
+from typing import Optional, Tuple
+
+# src/utils/setup_logger.py -> racine du projet
+_HERE = os.path.dirname(os.path.abspath(__file__))
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(_HERE))
+_LOGS_DIR = os.path.join(_PROJECT_ROOT, "logs")
+
+
+def _parse_log_level(value: str) -> int:
+    """Turn ``LOG_LEVEL`` (a level name or number) into a numeric logging level."""
+    value = value.strip().upper()
+    if value.isdigit():
+        return int(value)
+    level = logging.getLevelName(value)
+    if not isinstance(level, int):
+        raise ValueError(
+            f"Invalid LOG_LEVEL {value!r}: expected DEBUG, INFO, WARNING, ERROR, "
+            "CRITICAL or a numeric level"
+        )
+    return level
+
+
+@lru_cache(maxsize=None)
+def _log_settings() -> Tuple[int, int, int]:
+    """Read and validate ``LOG_LEVEL``, ``LOG_MAX_BYTES`` and ``LOG_BACKUP_COUNT``.
+
+    Called on the first ``setup_logger()``, so values loaded by a scraper's
+    ``load_dotenv()`` are taken into account.
+    """
+    # Niveau du logger et du fichier ; au-dessus de DEBUG, les logger.debug()
+    # des scrapers s'arrêtent à isEnabledFor() sans créer de LogRecord
+    level = _parse_log_level(os.getenv("LOG_LEVEL", "DEBUG"))
+
+    # Rotation des fichiers de log : 50 Mo x 5 archives par défaut
+    max_bytes = int(os.getenv("LOG_MAX_BYTES", 50 * 1024 * 1024))
+    backup_count = int(os.getenv("LOG_BACKUP_COUNT", 5))
+
+    return level, max_bytes, backup_count
+
+
+class CachedTimeFormatter(logging.Formatter):
+    """Render ``asctime - [name - ]levelname - message`` without ``%`` substitution.
+
+    ``asctime`` is rendered once per second instead of once per record.
+    """
+
+    def __init__(self, with_name: bool = True):
+        if with_name:
+            fmt = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+        else:
+            fmt = "%(asctime)s - %(levelname)s - %(message)s"
+        super().__init__(fmt)
+        self._with_name = with_name
+        # (seconde, datefmt, texte) dans un seul tuple : l'instance est partagée
+        # entre les threads des QueueListener, le triplet doit rester cohérent
+        self._cached_time = (None, None, "")
+
+    def formatMessage(self, record):
+        # équivalent de self._fmt, construit directement
+        if self._with_name:
+            return f"{record.asctime} - {record.name} - {record.levelname} - {record.message}"
+        return f"{record.asctime} - {record.levelname} - {record.message}"
+
+    def formatTime(self, record, datefmt=None):
+        sec = int(record.created)
+        cached_sec, cached_datefmt, cached_str = self._cached_time
+        if sec != cached_sec or datefmt != cached_datefmt:
+            cached_str = time.strftime(
+                datefmt or self.default_time_format, self.converter(sec)
+            )
+            self._cached_time = (sec, datefmt, cached_str)
+        if datefmt:
+            return cached_str
+        return self.default_msec_format % (cached_str, record.msecs)
+
+
+_FILE_FORMATTER = CachedTimeFormatter()
+_CONSOLE_FORMATTER = CachedTimeFormatter(with_name=False)
+
+
+class _ListenerQueueHandler(QueueHandler):
+    """``QueueHandler`` owning the ``QueueListener`` that drains its queue.
+
+    Closing the handler stops the listener once the queue is empty, then closes
+    the target handlers. Since it is created after them, ``logging.shutdown()``
+    closes it first.
+    """
+
+    def __init__(self, *handlers: logging.Handler):
+        super().__init__(queue.Queue())
+        self.listener = QueueListener(
+            self.queue, *handlers, respect_handler_level=True
+        )
+        self.listener.start()
+
+    def close(self):
+        listener, self.listener = self.listener, None
+        if listener is not None:
+            listener.stop()
+            for handler in listener.handlers:
+                handler.close()
+        super().close()
+
+
+# logger_name -> (subfolder, handler posé par _build_logger)
+_QUEUE_HANDLERS = {}
+
+
+def setup_logger(logger_name: str, subfolder: Optional[str] = None) -> logging.Logger:
+    """Return a logger writing to ``logs/[subfolder/]<logger_name>.log`` and the console.
+
+    Records are handed to a background ``QueueListener`` thread, so the calling
+    scraper never blocks on file or console I/O. Repeated calls with the same
+    arguments return the already configured logger; asking for a configured
+    logger with a different ``subfolder`` raises ``ValueError``.
+    """
+    return _build_logger(logger_name, subfolder)
+
+
+@lru_cache(maxsize=None)
+def _log_dir(subfolder: Optional[str]) -> str:
+    """Create ``logs/[subfolder]`` once per process and return it."""
+    logs_dir = os.path.join(_LOGS_DIR, subfolder) if subfolder else _LOGS_DIR
+    os.makedirs(logs_dir, exist_ok=True)
+    return logs_dir
+
+
+@lru_cache(maxsize=None)
+def _build_logger(logger_name: str, subfolder: Optional[str]) -> logging.Logger:
+    registered = _QUEUE_HANDLERS.get(logger_name)
+    if registered is not None and registered[0] != subfolder:
+        raise ValueError(
+            f"Logger {logger_name!r} is already set up with subfolder "
+            f"{registered[0]!r}, not {subfolder!r}"
+        )
+
+    level, max_bytes, backup_count = _log_settings()
+    log_file = os.path.join(_log_dir(subfolder), f"{logger_name}.log")
+
+    logger = logging.getLogger(logger_name)
+    logger.setLevel(level)
+    logger.propagate = False
+
+    # testé sur le registre et non sur logger.handlers : un handler ajouté par
+    # ailleurs (NullHandler, Airflow) ne doit pas empêcher de poser le nôtre
+    if registered is None:
+        # delay=True : le fichier n'est ouvert qu'au premier message
+        file_handler = RotatingFileHandler(
+            log_file,
+            maxBytes=max_bytes,
+            backupCount=backup_count,
+            encoding="utf-8",
+            delay=True,
+        )
+        file_handler.setLevel(level)
+        file_handler.setFormatter(_FILE_FORMATTER)
+
+        console_handler = logging.StreamHandler()
+        console_handler.setLevel(logging.INFO)
+        console_handler.setFormatter(_CONSOLE_FORMATTER)
+
+        queue_handler = _ListenerQueueHandler(file_handler, console_handler)
+        _QUEUE_HANDLERS[logger_name] = (subfolder, queue_handler)
+        logger.addHandler(queue_handler)
+
+    return logger
+
+
+def _close_queue_handlers():
+    for _, queue_handler in _QUEUE_HANDLERS.values():
+        queue_handler.close()
+
+
+def _rebuild_after_fork():
+    """Give each configured logger a new queue and listener in a forked child.
+
+    The parent's listener threads do not survive ``fork()``, so without this the
+    child's records would pile up in a queue nobody drains.
+    """
+    configured = list(_QUEUE_HANDLERS.items())
+    _QUEUE_HANDLERS.clear()
+    _build_logger.cache_clear()
+    for logger_name, (subfolder, queue_handler) in configured:
+        # le thread du listener n'existe que dans le parent : on ne l'arrête
+        # pas, on ferme seulement les copies héritées de ses handlers
+        listener, queue_handler.listener = queue_handler.listener, None
+        if listener is not None:
+            for handler in listener.handlers:
+                handler.close()
+        queue_handler.close()
+        logging.getLogger(logger_name).removeHandler(queue_handler)
+        _build_logger(logger_name, subfolder)
+
+
+def _register_child_finalizer(_):
+    # Les enfants multiprocessing sortent via os._exit() sans passer par
+    # atexit/logging.shutdown() : on vide les files dans leurs finalizers.
+    mp_util.Finalize(None, _close_queue_handlers, exitpriority=0)
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_rebuild_after_fork)
+mp_util.register_after_fork(_close_queue_handlers, _register_child_finalizer)